@@ -1,5 +1,6 @@
 import os.path
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from types import SimpleNamespace
@@ -167,19 +168,50 @@ def _copy_shared_resources(
             msg = f"Shared resource file '{there}' does not exist. Looked within directory '{shared_path}'"
             raise Exception(msg)
         elif src.is_dir():
-            shutil.copytree(src, dst, dirs_exist_ok=True)
+            # Create the destination even when the directory is empty,
+            # as copytree used to.
+            dst.mkdir(parents=True, exist_ok=True)
+            contents = util.all_normal_files(src)
+            # The per-file copies (or links) are independent and
+            # IO-bound, so overlap them across a few threads.
+            with ThreadPoolExecutor(
+                max_workers=min(32, max(1, len(contents)))
+            ) as ex:
+                list(
+                    ex.map(
+                        lambda f, src=src, dst=dst: _link_or_copy(
+                            src / f, dst / f
+                        ),
+                        contents,
+                    )
+                )
             copied = {
-                os.path.join(here, f): os.path.join(there, f)
-                for f in util.all_normal_files(src)
+                os.path.join(here, f): os.path.join(there, f) for f in contents
             }
             result.update(copied)
         else:
-            shutil.copyfile(src, dst)
+            _link_or_copy(src, dst)
             result[here] = there
 
     return result
 
 
+def _link_or_copy(src, dst):
+    # The packet directory is the user's working space, so a hardlink
+    # to a writable shared resource would let their script write
+    # through it and silently corrupt the copy in shared/. Only link
+    # when the source itself is read-only (and so cannot be written
+    # through either name); otherwise pay for a real copy.
+    os.makedirs(os.path.dirname(dst), exist_ok=True)
+    if not os.access(src, os.W_OK):
+        try:
+            os.link(src, dst)
+            return
+        except OSError:
+            pass
+    shutil.copyfile(src, dst)
+
+
 def artefact(name, files):
     """Declare an artefact.
 
@@ -1,3 +1,5 @@
+import functools
+import json
 import os.path
 from dataclasses import dataclass, field
 from typing import Optional
@@ -10,14 +12,40 @@ from pyorderly.outpack.util import match_value
 
 
 def read_config(root_path):
-    with open(_config_path(root_path)) as f:
-        s = f.read()
-    return Config.from_json(s.strip())
+    path = _config_path(root_path)
+    # Key the cache on the file's stat so that changes made by other
+    # processes are picked up; writes from this process clear the cache
+    # explicitly in write_config.
+    st = os.stat(path)
+    return _read_config_cached(path, st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=32)
+def _read_config_cached(path, _mtime_ns, _size):
+    # Read the raw bytes in one go and let the JSON decoder deal with
+    # the encoding; this skips the incremental decoding and buffering of
+    # a text-mode file object.
+    with open(path, "rb") as f:
+        d = json.loads(f.read())
+    # Build the dataclasses directly rather than going through
+    # dataclasses_json's reflection-based from_json, which is slow for
+    # something read on every root_open. Unknown keys are ignored, as
+    # they were with from_json.
+    core = ConfigCore(
+        d["core"]["hash_algorithm"],
+        d["core"].get("path_archive"),
+        d["core"]["use_file_store"],
+        d["core"]["require_complete_tree"],
+    )
+    return Config(
+        d["schema_version"], core, _decode_location_dict(d["location"])
+    )
 
 
 def write_config(config, root_path):
     with open(_config_path(root_path), "w") as f:
         f.write(config.to_json())
+    _read_config_cached.cache_clear()
 
 
 def update_config(config, root_path):
@@ -30,7 +58,7 @@ def _encode_location_dict(d):
 
 
 def _decode_location_dict(d):
-    return {x["name"]: Location.from_dict(x) for x in d}
+    return {x["name"]: Location(x["name"], x["type"], x.get("args")) for x in d}
 
 
 @dataclass_json()
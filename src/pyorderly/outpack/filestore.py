@@ -19,12 +19,13 @@ class FileStore:
         dat = hash_parse(hash)
         return self._path / dat.algorithm / dat.value[:2] / dat.value[2:]
 
-    def get(self, hash, dst, *, overwrite=False):
+    def get(self, hash, dst, *, overwrite=False, mkdir=True):
         src = self.filename(hash)
         if not os.path.exists(src):
             msg = f"Hash '{hash}' not found in store"
             raise FileNotFoundError(ENOENT, msg)
-        os.makedirs(os.path.dirname(dst), exist_ok=True)
+        if mkdir:
+            os.makedirs(os.path.dirname(dst), exist_ok=True)
         if not overwrite and os.path.exists(dst):
             msg = f"Failed to copy '{src}' to '{dst}', file already exists"
             raise Exception(msg)
@@ -33,12 +34,27 @@ class FileStore:
     def exists(self, hash):
         return os.path.exists(self.filename(hash))
 
-    def put(self, src, hash, *, move=False):
+    def put(self, src, hash, *, move=False, link=False):
         hash_validate_file(src, hash)
         dst = self.filename(hash)
         if not os.path.exists(dst):
             os.makedirs(os.path.dirname(dst), exist_ok=True)
-            if move:
+            if link:
+                # Borrow the caller's inode rather than copying the
+                # bytes. This is only suitable for a temporary store
+                # (the pull store fills itself from files already on
+                # disk this way): the entry shares a writable inode
+                # with the caller's file, so it must never outlive the
+                # operation, and get() must stay a copy so the shared
+                # inode is never handed out again. Don't chmod here as
+                # that would strip write permission from the caller's
+                # file too.
+                try:
+                    os.link(src, dst)
+                    return hash
+                except OSError:
+                    shutil.copyfile(src, dst)
+            elif move:
                 shutil.move(src, dst)
             else:
                 shutil.copyfile(src, dst)
@@ -12,18 +12,22 @@ class Hash:
 
 
 def hash_file(path, algorithm="sha256"):
-    h = hashlib.new(algorithm)
-    blocksize = 128 * h.block_size
     with open(path, "rb") as f:
-        while chunk := f.read(blocksize):
-            h.update(chunk)
+        if hasattr(hashlib, "file_digest"):
+            # Python >= 3.11; hashes in C without the read loop coming
+            # back through the interpreter for every chunk.
+            h = hashlib.file_digest(f, algorithm)
+        else:
+            h = hashlib.new(algorithm)
+            blocksize = 128 * h.block_size
+            while chunk := f.read(blocksize):
+                h.update(chunk)
     return Hash(algorithm, h.hexdigest())
 
 
 def hash_string(data, algorithm):
     h = hashlib.new(algorithm)
     h.update(data.encode())
-    h.hexdigest()
     return Hash(algorithm, h.hexdigest())
 
 
@@ -1,12 +1,18 @@
 import math
+import os
+import random
 import re
-import secrets
 import time
 
 from pyorderly.outpack.util import iso_time_str
 
 RE_ID = re.compile("^[0-9]{8}-[0-9]{6}-[0-9a-f]{8}$")
 
+# Ids only need uniqueness, not unpredictability, so seed a process
+# local generator from the system entropy pool once rather than paying
+# a getrandom() syscall on every id.
+_rng = random.Random(os.urandom(16))
+
 
 def fractional_to_bytes(x):
     return f"{math.floor((x % 1) * pow(256, 2)):04x}"
@@ -14,8 +20,8 @@ def fractional_to_bytes(x):
 
 def outpack_id():
     t = time.time()
-    rand = secrets.token_hex(2)
-    return f"{iso_time_str(t)}-{fractional_to_bytes(t)}{rand}"
+    rand = _rng.getrandbits(16)
+    return f"{iso_time_str(t)}-{fractional_to_bytes(t)}{rand:04x}"
 
 
 def is_outpack_id(x: str):
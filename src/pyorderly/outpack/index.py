@@ -1,3 +1,4 @@
+import os
 import pathlib
 from dataclasses import dataclass
 
@@ -14,23 +15,39 @@ class IndexData:
     metadata: dict[str, MetadataCore]
     location: dict[str, dict[str, PacketLocation]]
     unpacked: list[str]
+    # Inverted index over file hashes: hash -> [(packet_id, path, size)]
+    files: dict[str, list[tuple[str, str, int]]]
 
     @staticmethod
     def new():
-        return IndexData({}, {}, [])
+        return IndexData({}, {}, [], {})
 
 
 class Index:
     def __init__(self, path):
         self._path = pathlib.Path(path)
         self.data = IndexData.new()
+        self._stamp = None
+
+    def invalidate(self):
+        """Force the next refresh to rescan, regardless of the stamp."""
+        self._stamp = None
 
     def rebuild(self):
+        self._stamp = _index_stamp(self._path)
         self.data = _index_update(self._path, IndexData.new())
         return self
 
     def refresh(self):
-        self.data = _index_update(self._path, self.data)
+        # Directory mtimes tell us if anything was added since we last
+        # looked; when nothing was, skip the scan entirely. The stamp
+        # is taken before scanning so a concurrent write at worst makes
+        # the next refresh rescan. Writers in this process call
+        # invalidate() as a belt-and-braces for coarse mtime clocks.
+        stamp = _index_stamp(self._path)
+        if stamp != self._stamp:
+            self.data = _index_update(self._path, self.data)
+            self._stamp = stamp
         return self
 
     def all_metadata(self) -> dict[str, MetadataCore]:
@@ -53,29 +70,57 @@ class Index:
     def unpacked(self) -> list[str]:
         return self.refresh().data.unpacked
 
+    def file_locations(self, hash) -> list[tuple[str, str, int]]:
+        """Find every file with this hash, as (packet_id, path, size)."""
+        return self.refresh().data.files.get(str(hash), [])
+
+
+def _index_stamp(path_root):
+    base = path_root / ".outpack"
+    path_location = base / "location"
+    stamp = [
+        ("metadata", os.stat(base / "metadata").st_mtime_ns),
+        ("location", os.stat(path_location).st_mtime_ns),
+    ]
+    with os.scandir(path_location) as entries:
+        for entry in entries:
+            stamp.append((entry.name, entry.stat().st_mtime_ns))
+    stamp.sort()
+    return tuple(stamp)
+
 
 def _index_update(path_root, data):
-    data.metadata = _read_metadata(path_root, data.metadata)
+    _read_metadata(path_root, data)
     data.location = _read_locations(path_root, data.location)
     data.unpacked = sorted(data.location["local"].keys())
     return data
 
 
 def _read_metadata(path_root, data):
+    # os.scandir gets the names from one directory read, where iterdir
+    # would also build a Path per entry we have usually already seen.
     path = path_root / ".outpack" / "metadata"
-    for p in path.iterdir():
-        if p.name not in data:
-            data[p.name] = read_metadata_core(p)
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.name not in data.metadata:
+                meta = read_metadata_core(entry.path)
+                data.metadata[entry.name] = meta
+                for f in meta.files:
+                    data.files.setdefault(f.hash, []).append(
+                        (meta.id, f.path, f.size)
+                    )
     return data
 
 
 def _read_locations(path_root, data) -> dict[str, dict[str, PacketLocation]]:
     path = path_root / ".outpack" / "location"
-    for loc in path.iterdir():
-        if loc.name not in data:
-            data[loc.name] = {}
-        d = data[loc.name]
-        for p in loc.iterdir():
-            if p.name not in d:
-                d[p.name] = read_packet_location(p)
+    with os.scandir(path) as locations:
+        for loc in locations:
+            if loc.name not in data:
+                data[loc.name] = {}
+            d = data[loc.name]
+            with os.scandir(loc.path) as entries:
+                for entry in entries:
+                    if entry.name not in d:
+                        d[entry.name] = read_packet_location(entry.path)
     return data
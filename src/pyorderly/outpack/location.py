@@ -1,4 +1,5 @@
 import collections
+import functools
 import shutil
 from pathlib import PurePath
 
@@ -96,17 +97,18 @@ def outpack_location_rename(old, new, root=None, *, locate=True):
 def location_resolve_valid(
     location, root, *, include_local, include_orphan, allow_no_locations
 ):
+    known = outpack_location_list(root)
     if location is None:
-        location = outpack_location_list(root)
+        location = known
     elif isinstance(location, str):
-        if location not in outpack_location_list(root):
+        if location not in known:
             msg = f"Unknown location: '{location}'"
             raise Exception(msg)
         location = [location]
     elif isinstance(location, collections.abc.Iterable) and all(
         isinstance(item, str) for item in location
     ):
-        unknown = set(location).difference(outpack_location_list(root))
+        unknown = set(location).difference(known)
         if unknown:
             unknown_text = "', '".join(unknown)
             msg = f"Unknown location: '{unknown_text}'"
@@ -119,10 +121,12 @@ def location_resolve_valid(
         )
         raise Exception(msg)
 
-    if not include_local and LOCATION_LOCAL in location:
-        location.remove(LOCATION_LOCAL)
-    if not include_orphan and LOCATION_ORPHAN in location:  # pragma: no cover
-        location.remove(LOCATION_ORPHAN)
+    exclude = set()
+    if not include_local:
+        exclude.add(LOCATION_LOCAL)
+    if not include_orphan:
+        exclude.add(LOCATION_ORPHAN)
+    location = [x for x in location if x not in exclude]
 
     if len(location) == 0 and not allow_no_locations:
         msg = "No suitable location found"
@@ -147,10 +151,20 @@ def _location_exists(root, name):
     return name in outpack_location_list(root)
 
 
+# Reusing a path driver keeps its underlying root (and incrementally
+# updated index) warm across repeated operations in one process. The
+# network drivers are not cached: they establish their connections in
+# __enter__ and tear them down in __exit__, so a cached instance would
+# save nothing and risks reusing a closed session.
+@functools.lru_cache(maxsize=64)
+def _path_driver(path):
+    return OutpackLocationPath(path)
+
+
 def _location_driver(location_name, root) -> LocationDriver:
     location = root.config.location[location_name]
     if location.type == "path":
-        return OutpackLocationPath(location.args["path"])
+        return _path_driver(location.args["path"])
     elif location.type == "ssh":
         return OutpackLocationSSH(
             location.args["url"],
@@ -1,5 +1,6 @@
 import builtins
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urljoin
 
 import requests
@@ -67,11 +68,17 @@ class OutpackLocationHTTP(LocationDriver):
 
     @override
     def metadata(self, ids: builtins.list[str]) -> dict[str, str]:
-        result = {}
-        for i in ids:
-            result[i] = self._client.get(f"metadata/{i}/text").text
-
-        return result
+        if not ids:
+            return {}
+        # One GET per id; issue them concurrently over the session's
+        # keep-alive connection pool rather than paying a round-trip
+        # each in sequence. The worker count stays within the pool size
+        # of the underlying adapter.
+        with ThreadPoolExecutor(max_workers=min(8, len(ids))) as ex:
+            contents = ex.map(
+                lambda i: self._client.get(f"metadata/{i}/text").text, ids
+            )
+            return dict(zip(ids, contents))
 
     @override
     def fetch_file(self, packet: MetadataCore, file: PacketFile, dest: str):
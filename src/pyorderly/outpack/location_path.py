@@ -1,6 +1,6 @@
 import builtins
 import os
-import shutil
+from concurrent.futures import ThreadPoolExecutor
 
 from typing_extensions import override
 
@@ -8,15 +8,30 @@ from pyorderly.outpack.location_driver import LocationDriver
 from pyorderly.outpack.metadata import MetadataCore, PacketFile, PacketLocation
 from pyorderly.outpack.root import find_file_by_hash, root_open
 from pyorderly.outpack.static import LOCATION_LOCAL
-from pyorderly.outpack.util import read_string
+from pyorderly.outpack.util import fast_copy, read_string
 
 
 class OutpackLocationPath(LocationDriver):
     def __init__(self, path):
         self.__root = root_open(path, locate=False)
+        self.__store = self.__root.files
+        self.__packets = None
+
+    def __local_packets(self) -> dict[str, PacketLocation]:
+        # Snapshot the local packets for the current operation, so that
+        # list and metadata need not re-walk the location directory on
+        # every call within it.
+        if self.__packets is None:
+            self.__packets = self.__root.index.location(LOCATION_LOCAL)
+        return self.__packets
 
     @override
     def __enter__(self):
+        # Path drivers are cached and reused across operations (see
+        # _path_driver), so discard any snapshot a previous operation
+        # left behind before warming a fresh one.
+        self.__packets = None
+        self.__local_packets()
         return self
 
     @override
@@ -25,26 +40,28 @@ class OutpackLocationPath(LocationDriver):
 
     @override
     def list(self) -> dict[str, PacketLocation]:
-        return self.__root.index.location(LOCATION_LOCAL)
+        return self.__local_packets()
 
     @override
     def metadata(self, packet_ids: builtins.list[str]) -> dict[str, str]:
-        all_ids = self.__root.index.location(LOCATION_LOCAL).keys()
-        missing_ids = set(packet_ids).difference(all_ids)
+        missing_ids = set(packet_ids).difference(self.__local_packets())
         if missing_ids:
             missing_msg = "', '".join(missing_ids)
             msg = f"Some packet ids not found: '{missing_msg}'"
             raise Exception(msg)
-        ret = {}
-        for packet_id in packet_ids:
-            path = self.__root.path / ".outpack" / "metadata" / packet_id
-            ret[packet_id] = read_string(path)
-        return ret
+        if not packet_ids:
+            return {}
+        # The reads are independent, so overlap them across a few
+        # threads rather than paying each open/read/close in sequence.
+        base = self.__root.path / ".outpack" / "metadata"
+        with ThreadPoolExecutor(max_workers=min(16, len(packet_ids))) as ex:
+            contents = ex.map(lambda i: read_string(base / i), packet_ids)
+            return dict(zip(packet_ids, contents))
 
     @override
     def fetch_file(self, _packet: MetadataCore, file: PacketFile, dest: str):
-        if self.__root.config.core.use_file_store:
-            path = self.__root.files.filename(file.hash)
+        if self.__store is not None:
+            path = self.__store.filename(file.hash)
             if not os.path.exists(path):
                 msg = f"Hash '{file.hash}' not found at location"
                 raise Exception(msg)
@@ -53,4 +70,4 @@ class OutpackLocationPath(LocationDriver):
             if path is None:
                 msg = f"Hash '{file.hash}' not found at location"
                 raise Exception(msg)
-        shutil.copyfile(path, dest)
+        fast_copy(path, dest)
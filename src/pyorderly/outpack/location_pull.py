@@ -1,8 +1,10 @@
 import itertools
 import os
 import time
+from collections import deque
 from collections.abc import Generator
-from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
 from dataclasses import dataclass
 from typing import Optional, Union
 
@@ -24,6 +26,7 @@ from pyorderly.outpack.root import (
     OutpackRoot,
     find_file_by_hash,
     mark_known,
+    mark_known_batch,
     root_open,
 )
 from pyorderly.outpack.search_options import SearchOptions
@@ -40,22 +43,59 @@ def outpack_location_pull_metadata(location=None, root=None, *, locate=True):
         include_orphan=False,
         allow_no_locations=True,
     )
-    for name in location_name:
-        with _location_driver(name, root) as driver:
-            available = list(driver.list().values())
-            known_packets = {
-                k: v
-                for loc in root.index.all_locations().values()
-                for k, v in loc.items()
-            }
-
-            _validate_hashes(name, available, known_packets)
-            _pull_missing_metadata(driver, root, name, available)
-            _mark_all_known(root, name, available)
+    # Flatten the index once, rather than re-traversing every location
+    # for each location we pull from; packets seen at earlier locations
+    # in the merge loop are added as we go so conflicts across the
+    # locations being pulled are still detected.
+    known_packets = {
+        k: v
+        for loc in root.index.all_locations().values()
+        for k, v in loc.items()
+    }
+    known_ids = set(root.index.all_metadata())
+
+    # Fetching only reads from the remote locations, so fan the
+    # locations out over a thread pool; everything that touches our
+    # root happens serially below, in the order the locations were
+    # given, so conflict detection behaves as in the serial version.
+    if len(location_name) > 1:
+        with ThreadPoolExecutor(max_workers=min(4, len(location_name))) as ex:
+            fetched = list(
+                ex.map(
+                    lambda name: _fetch_metadata(name, root, known_ids),
+                    location_name,
+                )
+            )
+    else:
+        fetched = [
+            _fetch_metadata(name, root, known_ids) for name in location_name
+        ]
+
+    for name, (available, metadata) in zip(location_name, fetched):
+        _validate_hashes(name, available, known_packets)
+        for packet in available:
+            if packet.packet in metadata and packet.packet not in known_ids:
+                _store_packet_metadata(
+                    root, name, packet, metadata[packet.packet]
+                )
+                known_ids.add(packet.packet)
+        _mark_all_known(root, name, available)
+        for packet in available:
+            known_packets.setdefault(packet.packet, packet)
 
     # TODO: mrc-4601 deorphan recovered packets
 
 
+def _fetch_metadata(
+    name: str, root: OutpackRoot, known_ids: set
+) -> tuple[list[PacketLocation], dict[str, str]]:
+    with _location_driver(name, root) as driver:
+        available = list(driver.list().values())
+        to_pull = [p.packet for p in available if p.packet not in known_ids]
+        metadata = driver.metadata(to_pull) if to_pull else {}
+    return available, metadata
+
+
 def _store_packet_metadata(
     root: OutpackRoot,
     location_name: str,
@@ -79,6 +119,7 @@ def _store_packet_metadata(
     filename = path_metadata / packet.packet
     with open(filename, "w") as f:
         f.writelines(metadata)
+    root.index.invalidate()
 
 
 def _get_remove_location_hint(location_name):
@@ -95,11 +136,12 @@ def _validate_hashes(
     location_packets: list[PacketLocation],
     known_packets: dict[str, PacketLocation],
 ):
-    mismatched_hashes = set()
-    for packet in location_packets:
-        packet_here = known_packets.get(packet.packet)
-        if packet_here is not None and packet_here.hash != packet.hash:
-            mismatched_hashes.add(packet.packet)
+    hash_there = {packet.packet: packet.hash for packet in location_packets}
+    mismatched_hashes = {
+        packet_id
+        for packet_id in hash_there.keys() & known_packets.keys()
+        if known_packets[packet_id].hash != hash_there[packet_id]
+    }
 
     if mismatched_hashes:
         id_text = "', '".join(mismatched_hashes)
@@ -120,16 +162,14 @@ def _validate_hashes(
 def _mark_all_known(
     root: OutpackRoot, location_name: str, packets: list[PacketLocation]
 ):
-    known_already = root.index.packets_in_location(root)
-    for packet in packets:
-        if packet.packet not in known_already:
-            mark_known(
-                root,
-                packet.packet,
-                location_name,
-                packet.hash,
-                packet.time,
-            )
+    known_already = root.index.location(location_name)
+    entries = [
+        (packet.packet, location_name, packet.hash, packet.time)
+        for packet in packets
+        if packet.packet not in known_already
+    ]
+    if entries:
+        mark_known_batch(root, entries)
 
 
 def outpack_location_pull_packet(
@@ -246,7 +286,12 @@ def location_pull_files(
         for file in files:
             path = find_file_by_hash(root, file.hash)
             if path is not None:
-                store.put(path, file.hash)
+                # Linking rather than copying into the store is safe
+                # only because the store is temporary (destroyed below)
+                # and everything extracted from it goes out as a copy
+                # (_location_pull_files_archive); the link never
+                # outlives this pull or becomes writable anywhere else.
+                store.put(path, file.hash, link=True)
                 no_found += 1
             else:
                 missing.append(file)
@@ -292,41 +337,54 @@ def _location_pull_hash_store(
 ):
     no_of_files = len(files)
     # TODO: show a nice progress bar for users
-    for idx, file in enumerate(files):
-        print(
-            f"Fetching file {idx + 1}/{no_of_files} "
-            f"({humanize.naturalsize(file.size)}) from '{location_name}'"
-        )
-        with store.tmp() as path:
+    #
+    # Fetching is IO-bound and the store insert is CPU-bound (it
+    # re-hashes the file to verify it), so pipeline them: while one
+    # file is hashed and moved into the store, fetch the next. The
+    # temporary paths stay alive on the stack until the whole batch is
+    # done; the moves empty them as the pipeline drains.
+    with ThreadPoolExecutor(max_workers=1) as ex, ExitStack() as stack:
+        pending = None
+        for idx, file in enumerate(files):
+            print(
+                f"Fetching file {idx + 1}/{no_of_files} "
+                f"({humanize.naturalsize(file.size)}) from '{location_name}'"
+            )
+            path = stack.enter_context(store.tmp())
             packet = root.index.metadata(file.packet_id)
             driver.fetch_file(packet, file, path)
-            store.put(path, file.hash)
+            if pending is not None:
+                pending.result()
+            pending = ex.submit(store.put, path, file.hash, move=True)
+        if pending is not None:
+            pending.result()
 
 
 def _location_pull_files_archive(packet_id: str, store, root: OutpackRoot):
     meta = root.index.metadata(packet_id)
-    dest_root = (
-        root.path / root.config.core.path_archive / meta.name / packet_id
+    # Join plain strings in the per-file loop; building a fresh Path
+    # object per file is surprisingly expensive for large packets.
+    dest_root = os.path.join(
+        os.fspath(root.path),
+        root.config.core.path_archive,
+        meta.name,
+        packet_id,
     )
+    # Files usually share a handful of directories; create each once up
+    # front rather than checking per file in the loop below.
+    for d in {
+        os.path.dirname(os.path.join(dest_root, f.path)) for f in meta.files
+    }:
+        os.makedirs(d, exist_ok=True)
     for file in meta.files:
-        store.get(file.hash, dest_root / file.path, overwrite=True)
-
-
-def _pull_missing_metadata(
-    driver: LocationDriver,
-    root: OutpackRoot,
-    location_name: str,
-    packets: list[PacketLocation],
-):
-    known_here = root.index.all_metadata()
-
-    to_pull = [p for p in packets if p.packet not in known_here]
-    metadata = driver.metadata([p.packet for p in to_pull])
-
-    for packet in to_pull:
-        _store_packet_metadata(
-            root, location_name, packet, metadata[packet.packet]
-        )
+        dest = os.path.join(dest_root, file.path)
+        # This must be a real copy: the archive is user-facing and
+        # writable, so sharing an inode with the store would let edits
+        # to the archive corrupt the store's verified content.
+        store.get(file.hash, dest, overwrite=True, mkdir=False)
+        # We just wrote this file from verified store content, so later
+        # lookups of the hash need not re-read it.
+        root.note_verified_file(file.hash, dest)
 
 
 @dataclass
@@ -415,7 +473,10 @@ def _location_build_pull_plan_packets(
     else:
         full = packet_ids
 
-    skip = set(full).intersection(index.unpacked())
+    # Membership lookups against the local location dict; going via
+    # unpacked() would walk every unpacked packet just to skip a few.
+    unpacked = index.location(LOCATION_LOCAL)
+    skip = {i for i in full if i in unpacked}
     fetch = set(full).difference(skip)
 
     return PullPlanPackets(
@@ -426,23 +487,18 @@ def _location_build_pull_plan_packets(
 def _find_all_dependencies(
     packet_ids: list[str], metadata: dict[str, MetadataCore]
 ) -> list[str]:
-    ret = set(packet_ids)
-    packets = set(packet_ids)
-    while packets:
-        dependency_ids = {
-            dependencies.packet
-            for packet_id in packets
-            if packet_id in metadata.keys()
-            for dependencies in (
-                []
-                if metadata.get(packet_id) is None
-                else metadata[packet_id].depends
-            )
-        }
-        packets = dependency_ids.difference(ret)
-        ret = packets.union(ret)
-
-    return sorted(ret)
+    seen = set(packet_ids)
+    queue = deque(packet_ids)
+    while queue:
+        meta = metadata.get(queue.popleft())
+        if meta is None:
+            continue
+        for dependency in meta.depends:
+            if dependency.packet not in seen:
+                seen.add(dependency.packet)
+                queue.append(dependency.packet)
+
+    return sorted(seen)
 
 
 def _location_build_pull_plan_location(
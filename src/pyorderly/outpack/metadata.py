@@ -67,11 +67,17 @@ class MetadataCore(DataClassJsonMixin):
     custom: Optional[dict]
 
     def file_hash(self, name):
-        for x in self.files:
-            if x.path == name:
-                return x.hash
-        msg = f"Packet {self.id} does not contain file '{name}'"
-        raise Exception(msg)
+        # Lazily index the files by path; copying out n files would
+        # otherwise scan the list once per file. The length check
+        # rebuilds the index in the unlikely event files was modified.
+        by_path = self.__dict__.get("_files_by_path")
+        if by_path is None or len(by_path) != len(self.files):
+            by_path = {x.path: x.hash for x in self.files}
+            self.__dict__["_files_by_path"] = by_path
+        if name not in by_path:
+            msg = f"Packet {self.id} does not contain file '{name}'"
+            raise Exception(msg)
+        return by_path[name]
 
 
 @dataclass
@@ -82,10 +88,13 @@ class PacketLocation(DataClassJsonMixin):
 
 
 def read_metadata_core(path) -> MetadataCore:
-    with open(path) as f:
-        return MetadataCore.from_json(f.read().strip())
+    # Read the raw bytes straight into the parser; decoding to str
+    # first (and stripping, which the parser tolerates anyway) just
+    # copies the buffer an extra time for every packet read.
+    with open(path, "rb") as f:
+        return MetadataCore.from_json(f.read())
 
 
 def read_packet_location(path) -> PacketLocation:
-    with open(path) as f:
-        return PacketLocation.from_json(f.read().strip())
+    with open(path, "rb") as f:
+        return PacketLocation.from_json(f.read())
@@ -1,5 +1,7 @@
+import os
 import shutil
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from pyorderly.outpack.copy_files import copy_files
@@ -19,9 +21,17 @@ from pyorderly.outpack.metadata import (
 from pyorderly.outpack.root import mark_known, root_open
 from pyorderly.outpack.schema import outpack_schema_version, validate
 from pyorderly.outpack.search import as_query, search_unique
+from pyorderly.outpack.static import LOCATION_LOCAL
 from pyorderly.outpack.tools import git_info
 from pyorderly.outpack.util import all_normal_files, as_posix_path
 
+# How much older than the recorded hash a file's mtime must be before
+# we trust an unchanged size+mtime to mean unchanged content. Some
+# filesystems store mtimes at one- or two-second granularity, so a
+# rewrite landing in the same quantum as the hash would be invisible to
+# stat; git's "racy clean" check uses the same idea.
+_RACY_HASH_WINDOW_NS = 2_000_000_000
+
 
 # TODO: most of these fields should be private.
 class Packet:
@@ -44,6 +54,10 @@ class Packet:
         self.custom = {}
         self.metadata = None
         self.immutable = {}
+        # path -> (size, mtime_ns, recorded_at_ns) captured when the
+        # file was marked immutable; lets end() skip re-hashing files
+        # that demonstrably have not changed since.
+        self._immutable_stats = {}
 
     def use_dependency(self, query, files=None, search_options=None):
         if files is None:
@@ -58,7 +72,7 @@ class Packet:
         # We only need the whole packet if `require_complete_tree` is True.
         # In other cases, `copy_files` can download individual files.
         needs_pull = self.root.config.core.require_complete_tree and (
-            id not in self.root.index.unpacked()
+            id not in self.root.index.location(LOCATION_LOCAL)
         )
         if needs_pull:
             outpack_location_pull_packet(
@@ -81,7 +95,15 @@ class Packet:
             hash_validate_file(path_full, self.immutable[path])
         else:
             hash_algorithm = self.root.config.core.hash_algorithm
+            # Stat before hashing; if the file changes in between, the
+            # recorded stat will not match at end() and we re-hash.
+            st = os.stat(path_full)
             self.immutable[path] = hash_file(path_full, hash_algorithm)
+            self._immutable_stats[path] = (
+                st.st_size,
+                st.st_mtime_ns,
+                time.time_ns(),
+            )
 
     def add_custom_metadata(self, key, value):
         if key in self.custom:
@@ -96,7 +118,7 @@ class Packet:
         self.time["end"] = time.time()
         hash_algorithm = self.root.config.core.hash_algorithm
         self.files = [
-            PacketFile.from_file(self.path, as_posix_path(f), hash_algorithm)
+            self._packet_file(as_posix_path(f), hash_algorithm)
             for f in all_normal_files(self.path)
         ]
         _check_immutable_files(self.files, self.immutable)
@@ -110,6 +132,25 @@ class Packet:
 
         return self.metadata
 
+    def _packet_file(self, path, hash_algorithm):
+        # The git/rsync staleness check: if an immutable file's size
+        # and mtime are unchanged since we hashed it, and the mtime
+        # predates that hashing by more than the filesystem's timestamp
+        # granularity could hide, reuse the recorded hash rather than
+        # reading the file again. Anything else goes the normal route,
+        # and _check_immutable_files still catches mismatches.
+        cached = self._immutable_stats.get(path)
+        if cached is not None:
+            size, mtime_ns, recorded_at_ns = cached
+            st = os.stat(self.path / path)
+            if (
+                st.st_size == size
+                and st.st_mtime_ns == mtime_ns
+                and recorded_at_ns - mtime_ns > _RACY_HASH_WINDOW_NS
+            ):
+                return PacketFile(path, size, str(self.immutable[path]))
+        return PacketFile.from_file(self.path, path, hash_algorithm)
+
     def _build_metadata(self):
         return MetadataCore(
             outpack_schema_version(),
@@ -133,11 +174,29 @@ def insert_packet(root, path, meta):
             root.files.put(path / p.path, p.hash)
 
     if root.config.core.path_archive:
-        dest = root.path / "archive" / meta.name / meta.id
-        for p in meta.files:
-            p_dest = dest / p.path
-            p_dest.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy(path / p.path, p_dest)
+        # Work with plain strings here; a Path allocation per file adds
+        # up for packets with many outputs.
+        src = os.fspath(path)
+        dest = os.path.join(os.fspath(root.path), "archive", meta.name, meta.id)
+        # Many files usually share a directory; create each one once
+        # rather than issuing a mkdir per file.
+        for d in {
+            os.path.dirname(os.path.join(dest, p.path)) for p in meta.files
+        }:
+            os.makedirs(d, exist_ok=True)
+        # The copies are independent and IO-bound, so overlap them.
+        with ThreadPoolExecutor(
+            max_workers=min(32, max(1, len(meta.files)))
+        ) as ex:
+            list(
+                ex.map(
+                    lambda p: shutil.copy(
+                        os.path.join(src, p.path),
+                        os.path.join(dest, p.path),
+                    ),
+                    meta.files,
+                )
+            )
 
     json = meta.to_json(separators=(",", ":"))
     hash_meta = hash_string(json, root.config.core.hash_algorithm)
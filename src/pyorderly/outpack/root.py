@@ -1,5 +1,5 @@
+import functools
 import os
-import shutil
 from errno import ENOENT
 from pathlib import Path
 from typing import Optional, Union
@@ -10,18 +10,41 @@ from pyorderly.outpack.hash import hash_file, hash_parse
 from pyorderly.outpack.index import Index
 from pyorderly.outpack.metadata import PacketLocation
 from pyorderly.outpack.schema import validate
-from pyorderly.outpack.util import find_file_descend
+from pyorderly.outpack.static import LOCATION_LOCAL
+from pyorderly.outpack.util import fast_copy, find_file_descend
 
 
 class OutpackRoot:
-    files: Optional[FileStore] = None
-
     def __init__(self, path):
         self.path = Path(path)
         self.config = read_config(path)
-        if self.config.core.use_file_store:
-            self.files = FileStore(self.path / ".outpack" / "files")
         self.index = Index(path)
+        # Cache of archive files we have already hash-verified, as
+        # hash -> (path, size, mtime_ns); see find_file_by_hash.
+        self._files_verified = {}
+
+    @functools.cached_property
+    def files(self) -> Optional[FileStore]:
+        # Opening the store touches disk (it creates the directory if
+        # missing), so defer it until something actually needs a file;
+        # many operations only read config and metadata.
+        if not self.config.core.use_file_store:
+            return None
+        return FileStore(self.path / ".outpack" / "files")
+
+    def note_verified_file(self, hash, path):
+        """
+        Record that the file at ``path`` is known to have ``hash``.
+
+        Called when we have just written (or verified) a file ourselves
+        so that later find_file_by_hash lookups can skip re-hashing it.
+        """
+        st = os.stat(path)
+        self._files_verified[str(hash)] = (
+            Path(path),
+            st.st_size,
+            st.st_mtime_ns,
+        )
 
     def export_file(self, id, there, here, dest):
         meta = self.index.metadata(id)
@@ -44,7 +67,7 @@ class OutpackRoot:
                 msg = f"File not found in archive, or corrupt: {there}"
                 raise FileNotFoundError(ENOENT, msg, there)
             here_full.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copyfile(src, here_full)
+            fast_copy(src, here_full)
         return here
 
 
@@ -78,26 +101,83 @@ def root_open(
 def find_file_by_hash(root, hash):
     path_archive = root.path / root.config.core.path_archive
     hash_parsed = hash_parse(hash)
-    for id in root.index.unpacked():
+
+    # If we have verified a file with this hash before, trust it again
+    # so long as it looks untouched (same size and mtime); workflows
+    # that export the same artefact repeatedly would otherwise re-read
+    # and re-hash the file every time.
+    cached = root._files_verified.get(str(hash))
+    if cached is not None:
+        path, size, mtime_ns = cached
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            st = None
+        if st is not None and st.st_size == size and st.st_mtime_ns == mtime_ns:
+            return path
+        del root._files_verified[str(hash)]
+
+    # Membership against the local location dict, rather than building
+    # a fresh set from unpacked() (which also sorts), on every call.
+    unpacked = root.index.location(LOCATION_LOCAL)
+    # The index maintains an inverted hash -> files mapping, so look
+    # the candidates up directly rather than scanning every packet's
+    # metadata; sort so candidates are tried in packet id order, as the
+    # full scan used to.
+    for id, file_path, size in sorted(root.index.file_locations(hash)):
+        if id not in unpacked:
+            continue
         meta = root.index.metadata(id)
-        for f in meta.files:
-            if f.hash == hash:
-                path = path_archive / meta.name / meta.id / f.path
-                if hash_file(path, hash_parsed.algorithm) == hash_parsed:
-                    return path
-                else:
-                    msg = (
-                        f"Rejecting file from archive '{f.path}' "
-                        f"in '{meta.name}/{meta.id}'"
-                    )
-                    print(msg)
+        path = path_archive / meta.name / id / file_path
+        # A size mismatch means the file cannot hash correctly, so rule
+        # it out before reading the whole file.
+        st = path.stat()
+        if st.st_size != size:
+            found = None
+        else:
+            found = hash_file(path, hash_parsed.algorithm)
+        if found == hash_parsed:
+            root._files_verified[str(hash)] = (path, size, st.st_mtime_ns)
+            return path
+        else:
+            msg = (
+                f"Rejecting file from archive '{file_path}' "
+                f"in '{meta.name}/{id}'"
+            )
+            print(msg)
     return None
 
 
 def mark_known(root, packet_id, location, hash, time):
-    dat = PacketLocation(packet_id, time, str(hash))
-    validate(dat.to_dict(), "outpack/location.json")
-    dest = root.path / ".outpack" / "location" / location / packet_id
-    dest.parent.mkdir(parents=True, exist_ok=True)
-    with open(dest, "w") as f:
-        f.write(dat.to_json(separators=(",", ":")))
+    mark_known_batch(root, [(packet_id, location, hash, time)])
+
+
+def mark_known_batch(root, entries):
+    """
+    Mark many packets as known in one go.
+
+    Entries are (packet_id, location, hash, time) tuples. Each entry is
+    still validated individually, but directory creation is done once
+    per location and the small writes go through raw file descriptors
+    rather than buffered file objects; pulling metadata for a large
+    location marks thousands of packets at once.
+    """
+    base = root.path / ".outpack" / "location"
+    for location in {x[1] for x in entries}:
+        (base / location).mkdir(parents=True, exist_ok=True)
+    for packet_id, location, hash, time in entries:
+        dat = PacketLocation(packet_id, time, str(hash))
+        validate(dat.to_dict(), "outpack/location.json")
+        payload = dat.to_json(separators=(",", ":")).encode("utf-8")
+        fd = os.open(
+            base / location / packet_id,
+            os.O_WRONLY | os.O_CREAT | os.O_TRUNC,
+            0o644,
+        )
+        try:
+            written = 0
+            while written < len(payload):
+                written += os.write(fd, payload[written:])
+        finally:
+            os.close(fd)
+    root.index.invalidate()
@@ -1,6 +1,6 @@
 LOCATION_LOCAL = "local"
 LOCATION_ORPHAN = "orphan"
-LOCATION_RESERVED_NAME = [LOCATION_LOCAL, LOCATION_ORPHAN]
+LOCATION_RESERVED_NAME = frozenset({LOCATION_LOCAL, LOCATION_ORPHAN})
 LOCATION_TYPES = [
     LOCATION_LOCAL,
     LOCATION_ORPHAN,
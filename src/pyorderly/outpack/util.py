@@ -1,24 +1,25 @@
 import datetime
 import os
+import shutil
 import tempfile
 import time
 from contextlib import contextmanager
-from itertools import filterfalse, tee
 from pathlib import Path, PurePath
 from typing import Optional, Union, overload
 
 
 def find_file_descend(filename, path):
-    path = Path(path)
-    root = Path(path.anchor)
-
-    while path != root:
-        attempt = path / filename
-        if attempt.exists():
-            return str(attempt.parent)
-        path = path.parent
-
-    return None
+    # Plain string operations here; this runs on every root discovery
+    # and pathlib allocates a new object (and stats through a Path) per
+    # level. As before, the filesystem root itself is never checked.
+    path = os.path.abspath(path)
+    while True:
+        parent = os.path.dirname(path)
+        if parent == path:
+            return None
+        if os.path.exists(os.path.join(path, filename)):
+            return path
+        path = parent
 
 
 def iso_time_str(t):
@@ -37,14 +38,23 @@ def num_to_time(x):
 # relative to that path.
 #
 # This excludes any files contained in a `__pycache__` directory.
+#
+# This uses an iterative os.scandir walk rather than os.walk; scandir
+# exposes the entry type without an extra stat call and slicing the
+# entry path avoids allocating a Path object per file.
 def all_normal_files(path):
+    base = os.path.normpath(os.fspath(path))
+    prefix_len = len(base) + (0 if base.endswith(os.sep) else 1)
     result = []
-    for root, dirs, files in os.walk(path):
-        base = Path(root).relative_to(path)
-        result.extend(str(base.joinpath(f)) for f in files)
-
-        if "__pycache__" in dirs:
-            dirs.remove("__pycache__")
+    stack = [base]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name != "__pycache__":
+                        stack.append(entry.path)
+                else:
+                    result.append(entry.path[prefix_len:])
     return result
 
 
@@ -61,11 +71,16 @@ def transient_working_directory(path):
 
 
 def assert_file_exists(path, *, workdir=None, name="File"):
-    with transient_working_directory(workdir):
-        if isinstance(path, list):
-            missing = [str(p) for p in path if not os.path.exists(p)]
-        else:
-            missing = [] if os.path.exists(path) else [path]
+    # Resolve each path against workdir explicitly rather than changing
+    # directory; chdir is a process-global operation and costs two
+    # syscalls each way.
+    def exists(p):
+        return os.path.exists(os.path.join(workdir, p) if workdir else p)
+
+    if isinstance(path, list):
+        missing = [str(p) for p in path if not exists(p)]
+    else:
+        missing = [] if exists(path) else [path]
     if len(missing):
         missing_str = ", ".join(missing)
         msg = f"{name} does not exist: {missing_str}"
@@ -73,6 +88,19 @@ def assert_file_exists(path, *, workdir=None, name="File"):
 
 
 def assert_relative_path(path: str, name: str):
+    # Fast path: a string with no drive separator, no backslash, no
+    # leading slash and no '..' anywhere cannot fail any of the checks
+    # below, so skip building a PurePath for it. This only ever
+    # accepts; anything suspicious falls through to the full check.
+    s = os.fspath(path)
+    if (
+        ":" not in s
+        and "\\" not in s
+        and ".." not in s
+        and not s.startswith("/")
+    ):
+        return
+
     path = Path(path)
 
     # On Windows, this is not equivalent to path.is_absolute().
@@ -98,13 +126,44 @@ def expand_dirs(paths, *, workdir=None):
     if len(paths) == 0:
         return []
     ret = []
-    with transient_working_directory(workdir):
-        for p in paths:
-            if os.path.isdir(p):
-                ret += [os.path.join(p, f) for f in all_normal_files(p)]
-            else:
-                ret.append(str(p))
-    return ret
+    for p in paths:
+        full = os.path.join(workdir, p) if workdir else p
+        if os.path.isdir(full):
+            ret += [os.path.join(p, f) for f in all_normal_files(full)]
+        else:
+            ret.append(str(p))
+    # A user may list both a directory and files within it; dedupe
+    # (preserving order) so downstream hashing only sees each file once.
+    return list(dict.fromkeys(ret))
+
+
+def fast_copy(src, dst):
+    """
+    Copy the contents of ``src`` to ``dst``.
+
+    Where the platform supports it this uses ``os.copy_file_range``,
+    which lets the kernel copy (or, on filesystems with copy-on-write
+    support, reflink) the data without moving it through userspace.
+    Everywhere else this is equivalent to ``shutil.copyfile``.
+    """
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    n = os.copy_file_range(
+                        fsrc.fileno(), fdst.fileno(), remaining
+                    )
+                    if n == 0:
+                        break
+                    remaining -= n
+                if remaining == 0:
+                    return dst
+        except OSError:
+            # Cross-device copies and old kernels end up here; redo the
+            # copy in full with the portable fallback below.
+            pass
+    return shutil.copyfile(src, dst)
 
 
 def match_value(arg, choices, name):
@@ -161,15 +220,16 @@ def pl(x, singular, plural=None):
 
 
 def partition(pred, iterable):
-    """Partition entries into false entries and true entries.
+    """Partition entries into true entries and false entries.
 
-    This is slightly modified version of partition from itertools
-    recipes https://docs.python.org/dev/library/itertools.html#itertools-recipes
-    If *pred* is slow, consider wrapping it with functools.lru_cache().
+    This makes a single pass over the iterable, calling *pred* exactly
+    once per element.
     """
     # partition(is_odd, range(10)) --> 1 3 5 7 9 and 0 2 4 6 8
-    t1, t2 = tee(iterable)
-    return list(filter(pred, t1)), list(filterfalse(pred, t2))
+    true, false = [], []
+    for x in iterable:
+        (true if pred(x) else false).append(x)
+    return true, false
 
 
 @contextmanager
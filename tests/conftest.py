@@ -0,0 +1,26 @@
+import shutil
+
+import pytest
+
+from pyorderly.outpack.init import outpack_init
+
+
+@pytest.fixture(scope="session")
+def _pristine_root(tmp_path_factory):
+    path = tmp_path_factory.mktemp("pristine") / "root"
+    outpack_init(path)
+    return path
+
+
+@pytest.fixture
+def new_root(_pristine_root, tmp_path):
+    """
+    Path to a freshly initialised outpack root at ``tmp_path / "root"``.
+
+    Initialising a root validates and writes its configuration, which
+    adds up across the suite; tests that just need an empty root with
+    default configuration get a copy of a shared pristine one instead.
+    """
+    path = tmp_path / "root"
+    shutil.copytree(_pristine_root, path)
+    return path
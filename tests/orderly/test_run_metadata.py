@@ -67,6 +67,21 @@ def test_shared_resource_can_copy_single_name(tmp_path):
     assert res == {"numbers.txt": "numbers.txt"}
 
 
+def test_shared_resource_copies_do_not_alias_writable_sources(tmp_path):
+    root = helpers.create_temporary_root(tmp_path)
+    helpers.copy_shared_resources("numbers.txt", root)
+
+    src = tmp_path / "src" / "x"
+    src.mkdir(parents=True)
+    with transient_working_directory(src):
+        pyorderly.shared_resource("numbers.txt")
+
+    # Writing to the copy must not write through to shared/.
+    original = (tmp_path / "shared" / "numbers.txt").read_text()
+    (src / "numbers.txt").write_text("overwritten\n")
+    assert (tmp_path / "shared" / "numbers.txt").read_text() == original
+
+
 def test_shared_resource_can_copy_multiple_names(tmp_path):
     from os.path import join
 
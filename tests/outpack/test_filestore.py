@@ -55,6 +55,20 @@ def test_can_store_files(tmp_path):
     assert len(s.ls()) == 10
 
 
+def test_can_put_files_by_linking(tmp_path):
+    p = tmp_path / "a"
+    with open(p, "w") as f:
+        f.write(randstr(10))
+    s = FileStore(str(tmp_path / "store"))
+    h = hash_file(p, "md5")
+    assert s.put(p, h, link=True) == h
+    assert s.exists(h)
+    assert p.exists()
+    # The source file keeps its permissions, even though files the
+    # store owns outright are made read-only.
+    assert os.access(p, os.W_OK)
+
+
 @pytest.mark.skipif(
     platform.system() != "Windows",
     reason="destroy onerror handler only invoked on Windows \
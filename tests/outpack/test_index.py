@@ -3,6 +3,7 @@ import shutil
 
 import pytest
 
+import pyorderly.outpack.index
 from pyorderly.outpack.index import Index
 from pyorderly.outpack.metadata import read_metadata_core
 
@@ -27,6 +28,27 @@ def test_can_create_index():
     assert idx.unpacked() == ids
 
 
+def test_can_find_files_by_hash():
+    idx = Index("example")
+    packet = "20230807-152344-ee606dce"
+    meta = idx.metadata(packet)
+    f = meta.files[0]
+    assert (packet, f.path, f.size) in idx.file_locations(f.hash)
+    assert idx.file_locations("sha256:does-not-exist") == []
+
+
+def test_refresh_skips_scan_when_directories_unchanged(tmp_path, mocker):
+    shutil.copytree("example", tmp_path, dirs_exist_ok=True)
+    spy = mocker.spy(pyorderly.outpack.index, "_index_update")
+    idx = Index(tmp_path)
+    idx.refresh()
+    idx.refresh()
+    assert spy.call_count == 1
+    idx.invalidate()
+    idx.refresh()
+    assert spy.call_count == 2
+
+
 def test_rebuild_can_pick_up_deletions(tmp_path):
     shutil.copytree("example", tmp_path, dirs_exist_ok=True)
     idx1 = Index(tmp_path)
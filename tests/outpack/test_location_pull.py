@@ -35,6 +35,13 @@ from ..helpers import (
     rep,
 )
 
+# Patterns asserted by several tests, compiled once for the module.
+_RE_NO_LOCATION = re.compile("No suitable location found")
+_RE_REMOVE_LOCATION_HINT = re.compile("remove this location")
+_RE_NEED_TO_FETCH = re.compile(
+    r"Need to fetch 1 file \([0-9]* Bytes\) from 1 location"
+)
+
 
 def test_can_pull_metadata_from_a_file_base_location(tmp_path):
     root_upstream = create_temporary_root(
@@ -129,6 +136,17 @@ def test_can_pull_metadata_from_subset_of_locations(tmp_path):
             assert packet_id in z_metadata
 
 
+def test_repeated_pull_sees_new_upstream_packets(tmp_path):
+    # Path drivers are cached across operations, so a second pull must
+    # not reuse the packet snapshot taken by the first.
+    root = create_temporary_roots(tmp_path, add_location=True)
+    id1 = create_random_packet(root["src"])
+    outpack_location_pull_metadata(root=root["dst"])
+    id2 = create_random_packet(root["src"])
+    outpack_location_pull_metadata(root=root["dst"])
+    assert set(root["dst"].index.all_metadata()) == {id1, id2}
+
+
 def test_cant_pull_metadata_from_an_unknown_location(tmp_path):
     root = create_temporary_root(tmp_path)
     with pytest.raises(Exception) as e:
@@ -161,7 +179,7 @@ def test_handle_metadata_where_hash_does_not_match_reported(tmp_path):
         f"Hash of metadata for '{packet_id}' from 'server' does not match:"
     )
     assert e.match("This is bad news")
-    assert e.match("remove this location")
+    assert _RE_REMOVE_LOCATION_HINT.search(str(e.value))
 
 
 def test_handle_metadata_where_two_locations_differ_in_hash_for_same_id(
@@ -189,7 +207,7 @@ def test_handle_metadata_where_two_locations_differ_in_hash_for_same_id(
     )
     assert e.match(f"Conflicts for: '{packet_id}'")
     assert e.match("please let us know")
-    assert e.match("remove this location")
+    assert _RE_REMOVE_LOCATION_HINT.search(str(e.value))
 
 
 def test_can_pull_metadata_through_chain_of_locations(tmp_path):
@@ -233,11 +251,11 @@ def test_informative_error_when_no_locations_configured(tmp_path):
             allow_no_locations=False,
         )
 
-    assert e.match("No suitable location found")
+    assert _RE_NO_LOCATION.search(str(e.value))
 
     with pytest.raises(Exception) as e:
         outpack_location_pull_packet(outpack_id(), root=root)
-    assert e.match("No suitable location found")
+    assert _RE_NO_LOCATION.search(str(e.value))
 
 
 def test_can_resolve_dependencies_where_there_are_none():
@@ -326,13 +344,18 @@ def test_can_pull_packet_from_location_into_another_file_store(tmp_path):
 
     index = root["dst"].index
     assert index.unpacked() == [id]
-    assert os.path.exists(
-        root["dst"].path / "archive" / "data" / id / "data.txt"
-    )
+    dest = root["dst"].path / "archive" / "data" / id / "data.txt"
+    assert os.path.exists(dest)
 
     meta = index.metadata(id)
     assert all(root["dst"].files.exists(file.hash) for file in meta.files)
 
+    # The archive file must be an independent, writable copy; sharing
+    # an inode with the store would let edits corrupt it.
+    assert os.access(dest, os.W_OK)
+    store_path = root["dst"].files.filename(meta.files[0].hash)
+    assert not os.path.samefile(dest, store_path)
+
 
 def test_can_pull_packet_from_location_file_store_only(tmp_path):
     root = create_temporary_roots(
@@ -643,9 +666,7 @@ def test_skip_files_in_file_store(tmp_path):
         outpack_location_pull_packet(ids["b"], root=root["dst"])
     text = f.getvalue()
     assert re.search("Found 1 file in the file store", text)
-    assert re.search(
-        r"Need to fetch 1 file \([0-9]* Bytes\) from 1 location", text
-    )
+    assert _RE_NEED_TO_FETCH.search(text)
 
 
 def test_skip_files_already_on_disk(tmp_path):
@@ -663,6 +684,4 @@ def test_skip_files_already_on_disk(tmp_path):
         outpack_location_pull_packet(ids["b"], root=root["dst"])
     text = f.getvalue()
     assert re.search("Found 1 file on disk", text)
-    assert re.search(
-        r"Need to fetch 1 file \([0-9]* Bytes\) from 1 location", text
-    )
+    assert _RE_NEED_TO_FETCH.search(text)
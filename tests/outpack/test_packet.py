@@ -11,9 +11,8 @@ from pyorderly.outpack.root import root_open
 from ..helpers import create_packet, create_random_packet, create_temporary_root
 
 
-def test_can_add_simple_packet(tmp_path):
-    root = tmp_path / "root"
-    outpack_init(root)
+def test_can_add_simple_packet(new_root):
+    root = new_root
 
     with create_packet(root, "data") as p:
         p.path.joinpath("a").write_text("hello")
@@ -64,10 +63,9 @@ def test_cant_end_packet_twice(tmp_path):
         p.end()
 
 
-def test_can_cancel_packet(tmp_path):
-    root = tmp_path / "root"
+def test_can_cancel_packet(tmp_path, new_root):
+    root = new_root
     src = tmp_path / "src"
-    outpack_init(root)
 
     src.mkdir(parents=True, exist_ok=True)
 
@@ -77,9 +75,8 @@ def test_can_cancel_packet(tmp_path):
     assert p.path.joinpath("outpack.json").exists()
 
 
-def test_can_insert_a_packet_into_existing_root(tmp_path):
-    root = tmp_path / "root"
-    outpack_init(root)
+def test_can_insert_a_packet_into_existing_root(new_root):
+    root = new_root
 
     with create_packet(root, "data") as p1:
         p1.path.joinpath("b").write_text("hello")
@@ -91,9 +88,8 @@ def test_can_insert_a_packet_into_existing_root(tmp_path):
     assert r.index.unpacked() == sorted([p1.id, p2.id])
 
 
-def test_can_add_custom_metadata(tmp_path):
-    root = tmp_path / "root"
-    outpack_init(root)
+def test_can_add_custom_metadata(new_root):
+    root = new_root
     d = {"a": 1, "b": 2}
 
     with create_packet(root, "data") as p:
@@ -107,9 +103,8 @@ def test_can_add_custom_metadata(tmp_path):
     assert r.index.metadata(p.id).custom["key"] == d
 
 
-def test_error_raised_if_same_custom_data_readded(tmp_path):
-    root = tmp_path / "root"
-    outpack_init(root)
+def test_error_raised_if_same_custom_data_readded(new_root):
+    root = new_root
 
     with create_packet(root, "data") as p:
         d = {"a": 1, "b": 2}
@@ -120,9 +115,8 @@ def test_error_raised_if_same_custom_data_readded(tmp_path):
             p.add_custom_metadata("myapp", d)
 
 
-def test_can_mark_files_as_immutable(tmp_path):
-    root = tmp_path / "root"
-    outpack_init(root)
+def test_can_mark_files_as_immutable(new_root):
+    root = new_root
 
     with create_packet(root, "data") as p:
         with open(p.path / "data.csv", "w") as f:
@@ -135,10 +129,9 @@ def test_can_mark_files_as_immutable(tmp_path):
     assert p.metadata.files[0].path == "data.csv"
 
 
-def test_can_validate_immutable_files_on_end(tmp_path):
-    root = tmp_path / "root"
+def test_can_validate_immutable_files_on_end(tmp_path, new_root):
+    root = new_root
     src = tmp_path / "src"
-    outpack_init(root)
     src.mkdir(parents=True, exist_ok=True)
     p = Packet(root, src, "data")
     with open(src / "data.csv", "w") as f:
@@ -148,9 +141,8 @@ def test_can_validate_immutable_files_on_end(tmp_path):
     assert len(p.metadata.files) == 1
 
 
-def test_can_detect_changes_to_immutable_files(tmp_path):
-    root = tmp_path / "root"
-    outpack_init(root)
+def test_can_detect_changes_to_immutable_files(new_root):
+    root = new_root
 
     with pytest.raises(
         Exception,
@@ -162,10 +154,9 @@ def test_can_detect_changes_to_immutable_files(tmp_path):
             p.path.joinpath("data.csv").write_text("a,b\n1,2\n3,4\n5,6\n")
 
 
-def test_readding_files_rehashes_them(tmp_path):
-    root = tmp_path / "root"
+def test_readding_files_rehashes_them(tmp_path, new_root):
+    root = new_root
     src = tmp_path / "src"
-    outpack_init(root)
     src.mkdir(parents=True, exist_ok=True)
     p = Packet(root, src, "data")
     with open(src / "data.csv", "w") as f:
@@ -176,10 +167,9 @@ def test_readding_files_rehashes_them(tmp_path):
         p.end()
 
 
-def test_can_detect_modification_of_immutable_file(tmp_path):
-    root = tmp_path / "root"
+def test_can_detect_modification_of_immutable_file(tmp_path, new_root):
+    root = new_root
     src = tmp_path / "src"
-    outpack_init(root)
     src.mkdir(parents=True, exist_ok=True)
     p1 = Packet(root, src, "data")
     with open(src / "data.csv", "w") as f:
@@ -200,11 +190,30 @@ def test_can_detect_modification_of_immutable_file(tmp_path):
         p.end()
 
 
-def test_can_detect_modification_of_immutable_file_if_readded(tmp_path):
+def test_can_detect_same_size_rewrite_in_same_mtime_quantum(tmp_path, new_root):
+    """Coarse-mtime filesystems can hide a rewrite behind unchanged stats."""
+    root = new_root
+    src = tmp_path / "src"
+    src.mkdir(parents=True, exist_ok=True)
+    p = Packet(root, src, "data")
+    path = src / "data.csv"
+    path.write_text("a,b\n1,2\n3,4\n")
+    p.mark_file_immutable("data.csv")
+    st = os.stat(path)
+    # Same length, then put the mtime back, as a filesystem with one-
+    # or two-second timestamps would report for a quick rewrite.
+    path.write_text("a,b\n9,9\n9,9\n")
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+    with pytest.raises(Exception, match="File was changed after being added"):
+        p.end()
+
+
+def test_can_detect_modification_of_immutable_file_if_readded(
+    tmp_path, new_root
+):
     """Test that it is the _first_ addition of the hash that matters."""
-    root = tmp_path / "root"
+    root = new_root
     src = tmp_path / "src"
-    outpack_init(root)
     src.mkdir(parents=True, exist_ok=True)
     p = Packet(root, src, "data")
     with open(src / "data.csv", "w") as f: